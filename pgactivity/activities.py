@@ -1,4 +1,5 @@
-import builtins
+import heapq
+import operator
 import os
 import time
 from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
@@ -19,25 +20,38 @@ from .types import (
 )
 
 
-def sys_get_proc(pid: int) -> Optional[SystemProcess]:
+def sys_get_proc(
+    pid: int,
+    io_time: Optional[float] = None,
+    psutil_proc: Optional[psutil.Process] = None,
+) -> Optional[SystemProcess]:
     """Return a SystemProcess instance matching given pid or None if access with psutil
     is not possible.
+
+    'io_time' is the (monotonic) timestamp of IO counters snapshot, it defaults
+    to current time.
+
+    'psutil_proc' is a psutil.Process, for the same pid, obtained at a previous
+    call; it is reused so that CPU usage is computed since that call.
     """
+    if io_time is None:
+        io_time = time.monotonic()
     try:
-        psproc = psutil.Process(pid)
-        meminfo = psproc.memory_info()
-        mem_percent = psproc.memory_percent()
-        cpu_percent = psproc.cpu_percent(interval=0)
-        cpu_times = psproc.cpu_times()
-        (
-            read_count,
-            write_count,
-            read_bytes,
-            write_bytes,
-            read_chars,
-            write_chars,
-        ) = psproc.io_counters()
-        status_iow = str(psproc.status())
+        psproc = psutil_proc if psutil_proc is not None else psutil.Process(pid)
+        with psproc.oneshot():
+            meminfo = psproc.memory_info()
+            mem_percent = psproc.memory_percent()
+            cpu_percent = psproc.cpu_percent(interval=0)
+            cpu_times = psproc.cpu_times()
+            (
+                read_count,
+                write_count,
+                read_bytes,
+                write_bytes,
+                read_chars,
+                write_chars,
+            ) = psproc.io_counters()
+            status_iow = str(psproc.status())
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return None
 
@@ -45,7 +59,7 @@ def sys_get_proc(pid: int) -> Optional[SystemProcess]:
         meminfo=meminfo,
         io_read=IOCounter(read_count, read_bytes, read_chars),
         io_write=IOCounter(write_count, write_bytes, write_chars),
-        io_time=time.time(),
+        io_time=io_time,
         mem_percent=mem_percent,
         cpu_percent=cpu_percent,
         cpu_times=cpu_times,
@@ -67,59 +81,43 @@ def ps_complete(
 
     The 'processes' map is updated in place.
     """
-    local_procs = []
+    local_procs: List[LocalRunningProcess] = []
+    # Bind method lookups once, out of the per-process loop.
+    add_local_proc = local_procs.append
+    from_process = LocalRunningProcess.from_process
     read_bytes_delta = 0.0
     write_bytes_delta = 0.0
-    read_count_delta = 0
-    write_count_delta = 0
-    n_io_time = time.time()
+    n_io_time = time.monotonic()
+    seen_pids = set()
     for pg_proc in pg_processes:
         pid = pg_proc.pid
-        new_proc = sys_get_proc(pid)
-        if new_proc is None:
+        # Getting informations from the previous loop, if any
+        prev_proc = processes.get(pid)
+        proc = sys_get_proc(
+            pid,
+            n_io_time,
+            prev_proc.psutil_proc if prev_proc is not None else None,
+        )
+        if proc is None:
+            # Process is gone (or not accessible), forget about it.
+            processes.pop(pid, None)
             continue
-        try:
-            # Getting informations from the previous loop
-            proc = processes[pid]
-        except KeyError:
-            # No previous information about this process
-            proc = new_proc
-        else:
-            # Update old process with new informations
-            mem_percent = proc.mem_percent
-            cpu_percent = proc.cpu_percent
-            if proc.psutil_proc is not None:
-                try:
-                    mem_percent = proc.psutil_proc.memory_percent()
-                    cpu_percent = proc.psutil_proc.cpu_percent(interval=0)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            proc = attr.evolve(
-                proc,
-                io_wait=new_proc.io_wait,
-                read_delta=(
-                    (new_proc.io_read.bytes - proc.io_read.bytes)
-                    / (n_io_time - proc.io_time)
-                ),
-                write_delta=(
-                    (new_proc.io_write.bytes - proc.io_write.bytes)
-                    / (n_io_time - proc.io_time)
-                ),
-                io_read=new_proc.io_read,
-                io_write=new_proc.io_write,
-                io_time=n_io_time,
-                mem_percent=mem_percent,
-                cpu_percent=cpu_percent,
-            )
+        if prev_proc is not None:
+            # IO rates since previous refresh
+            per_sec = 1.0 / (n_io_time - prev_proc.io_time)
+            read_delta = (proc.io_read.bytes - prev_proc.io_read.bytes) * per_sec
+            write_delta = (proc.io_write.bytes - prev_proc.io_write.bytes) * per_sec
+            proc = attr.evolve(proc, read_delta=read_delta, write_delta=write_delta)
 
             # Global io counters
-            read_bytes_delta += proc.read_delta
-            write_bytes_delta += proc.write_delta
+            read_bytes_delta += read_delta
+            write_bytes_delta += write_delta
 
         processes[pid] = proc
+        seen_pids.add(pid)
 
-        local_procs.append(
-            LocalRunningProcess.from_process(
+        add_local_proc(
+            from_process(
                 pg_proc,
                 cpu=proc.cpu_percent,
                 mem=proc.mem_percent,
@@ -129,11 +127,18 @@ def ps_complete(
             )
         )
 
+    # Forget about processes not seen in this refresh which are not running
+    # anymore (e.g. disconnected backends), so that their psutil handle is not
+    # reused if the pid gets reused. Others (e.g. idle backends) are kept in
+    # order to compute CPU and IO usage when they show up again.
+    for pid in processes.keys() - seen_pids:
+        psutil_proc = processes[pid].psutil_proc
+        if psutil_proc is not None and not psutil_proc.is_running():
+            del processes[pid]
+
     # store io counters
-    if read_bytes_delta > 0:
-        read_count_delta += int(read_bytes_delta / fs_blocksize)
-    if write_bytes_delta > 0:
-        write_count_delta += int(write_bytes_delta / fs_blocksize)
+    read_count_delta = max(0, int(read_bytes_delta / fs_blocksize))
+    write_count_delta = max(0, int(write_bytes_delta / fs_blocksize))
 
     io_read = IOCounter(count=read_count_delta, bytes=int(read_bytes_delta))
     io_write = IOCounter(count=write_count_delta, bytes=int(write_bytes_delta))
@@ -143,59 +148,69 @@ def ps_complete(
 
 T = TypeVar("T", RunningProcess, BWProcess, LocalRunningProcess)
 
+_SORT_KEY_GETTERS = {key: operator.attrgetter(key.name) for key in SortKey}
+
 
-def sorted(processes: List[T], *, key: SortKey, reverse: bool = False) -> List[T]:
-    """Return processes sorted.
+def sort(
+    processes: List[T],
+    *,
+    key: SortKey,
+    reverse: bool = False,
+    limit: Optional[int] = None,
+) -> None:
+    """Sort processes in place.
+
+    If 'limit' is specified, the 'limit' first processes in sort order are
+    moved ahead, sorted, and remaining ones are kept after in their original
+    order.
 
     >>> processes = [
-    ...     LocalRunningProcess(
-    ...         pid="6239",
+    ...     RunningProcess(
+    ...         pid=6239,
     ...         appname="pgbench",
     ...         database="pgbench",
     ...         user="postgres",
     ...         client="local",
-    ...         cpu=0.1,
-    ...         mem=0.993_254_939_413_836,
-    ...         read=0.1,
-    ...         write=0.282_725_318_098_656_75,
+    ...         duration=0.1,
     ...         state="idle in transaction",
     ...         query="UPDATE pgbench_accounts SET abalance = abalance + 141 WHERE aid = 1932841;",
-    ...         duration=0,
     ...         wait=False,
-    ...         io_wait=False,
     ...         is_parallel_worker=False,
     ...     ),
-    ...     LocalRunningProcess(
-    ...         pid="6228",
+    ...     RunningProcess(
+    ...         pid=6228,
     ...         appname="pgbench",
     ...         database="pgbench",
     ...         user="postgres",
     ...         client="local",
-    ...         cpu=0.2,
-    ...         mem=1.024_758_418_061_11,
-    ...         read=0.2,
-    ...         write=0.113_090_128_201_154_74,
+    ...         duration=1.2,
     ...         state="active",
     ...         query="UPDATE pgbench_accounts SET abalance = abalance + 3062 WHERE aid = 7289374;",
-    ...         duration=0,
     ...         wait=False,
-    ...         io_wait=False,
-    ...         is_parallel_worker=True,
+    ...         is_parallel_worker=False,
     ...     ),
     ... ]
 
-    >>> processes = sorted(processes, key=SortKey.cpu, reverse=True)
+    >>> sort(processes, key=SortKey.duration, reverse=True)
     >>> [p.pid for p in processes]
-    ['6228', '6239']
-    >>> processes = sorted(processes, key=SortKey.mem)
+    [6228, 6239]
+    >>> sort(processes, key=SortKey.duration)
     >>> [p.pid for p in processes]
-    ['6239', '6228']
+    [6239, 6228]
+
+    >>> processes = [attr.evolve(processes[0], pid=pid, duration=pid % 7) for pid in range(20)]
+    >>> sort(processes, key=SortKey.duration, reverse=True, limit=2)
+    >>> [p.pid for p in processes]
+    [6, 13, 0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 14, 15, 16, 17, 18, 19]
     """
-    return builtins.sorted(
-        processes,
-        key=lambda p: getattr(p, key.name),  # type: ignore  # TODO: avoid getattr()
-        reverse=reverse,
-    )
+    sort_key = _SORT_KEY_GETTERS[key]
+    if limit is None or limit * 8 >= len(processes):
+        processes.sort(key=sort_key, reverse=reverse)
+        return
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    head = select(limit, processes, key=sort_key)
+    head_ids = {id(p) for p in head}
+    processes[:] = head + [p for p in processes if id(p) not in head_ids]
 
 
 def update_max_iops(max_iops: int, read_count: float, write_count: float) -> int:
@@ -66,6 +66,9 @@ def verbose_mode(key: Keystroke, mode: QueryDisplayMode) -> QueryDisplayMode:
     return mode
 
 
+_QUERYMODE_FROM_KEYS_GET = keys.QUERYMODE_FROM_KEYS.get
+
+
 def query_mode(key: Keystroke) -> Optional[QueryMode]:
     """Return the query mode matching input key or None.
 
@@ -78,9 +81,17 @@ def query_mode(key: Keystroke) -> Optional[QueryMode]:
     >>> query_mode(k(code=curses.KEY_F3))
     <QueryMode.blocking: 'blocking queries'>
     """
-    if key.is_sequence and key.code in keys.QUERYMODE_FROM_KEYS:
-        key = key.code
-    return keys.QUERYMODE_FROM_KEYS.get(key)
+    return _QUERYMODE_FROM_KEYS_GET(key.code if key.is_sequence else key)
+
+
+_DEFAULT_SORT_KEY = SortKey.default()
+_SORT_KEY_BY_INPUT = {
+    keys.SORTBY_CPU: (SortKey.cpu, Flag.CPU),
+    keys.SORTBY_MEM: (SortKey.mem, Flag.MEM),
+    keys.SORTBY_READ: (SortKey.read, Flag.READ),
+    keys.SORTBY_TIME: (SortKey.duration, Flag.TIME),
+    keys.SORTBY_WRITE: (SortKey.write, Flag.WRITE),
+}
 
 
 def sort_key_for(
@@ -119,15 +130,9 @@ def sort_key_for(
     >>> sort_key_for(k("m"), QueryMode.activities, flag)
     """
     if query_mode != QueryMode.activities:
-        return SortKey.default()
+        return _DEFAULT_SORT_KEY
     try:
-        sort_key, required_flag = {
-            keys.SORTBY_CPU: (SortKey.cpu, Flag.CPU),
-            keys.SORTBY_MEM: (SortKey.mem, Flag.MEM),
-            keys.SORTBY_READ: (SortKey.read, Flag.READ),
-            keys.SORTBY_TIME: (SortKey.duration, Flag.TIME),
-            keys.SORTBY_WRITE: (SortKey.write, Flag.WRITE),
-        }[key]
+        sort_key, required_flag = _SORT_KEY_BY_INPUT[key]
     except KeyError:
         return None
     if flag & required_flag:
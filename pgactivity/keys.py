@@ -1,5 +1,5 @@
 import curses
-from typing import Any, List, Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import attr
 from blessed.keyboard import Keystroke
@@ -62,7 +62,7 @@ def is_process_prev(key: Keystroke) -> bool:
 EXIT_KEY = Key(EXIT, "quit")
 PAUSE_KEY = Key(SPACE, "pause/unpause", "Space")
 
-BINDINGS: List[Key] = [
+BINDINGS: Tuple[Key, ...] = (
     Key("Up/Down", "scroll process list"),
     PAUSE_KEY,
     Key(SORTBY_CPU, "sort by CPU% desc. (activities)", local_only=True),
@@ -77,7 +77,7 @@ BINDINGS: List[Key] = [
     Key(REFRESH_DB_SIZE, "force refresh database size"),
     Key("R", "force refresh"),
     EXIT_KEY,
-]
+)
 
 
 def _sequence_by_int(v: int) -> Tuple[str, str, int]:
@@ -99,6 +99,6 @@ QUERYMODE_FROM_KEYS = {
 }
 
 
-MODES: List[Key] = [
+MODES: Tuple[Key, ...] = tuple(
     Key("/".join(KEYS_BY_QUERYMODE[qm][:-1]), qm.value) for qm in QueryMode
-]
+)
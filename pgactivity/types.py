@@ -1,4 +1,5 @@
 import enum
+import functools
 import optparse
 from typing import (
     Any,
@@ -9,12 +10,14 @@ from typing import (
     List,
     Mapping,
     MutableSet,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 
 import attr
@@ -26,6 +29,41 @@ from . import colors, utils
 
 T = TypeVar("T")
 
+# Marker for missing items in mappings.
+_MISSING = object()
+
+
+class _DeserializableField(NamedTuple):
+    name: str
+    type: Any
+    required: bool
+    # Deserialization function for nested Deserializable types.
+    deserializer: Optional[Callable[[Any], Any]]
+    # Whether values can be type-checked with isinstance().
+    checkable: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _deserializable_fields(cls: type) -> Tuple[_DeserializableField, ...]:
+    """Return fields of an attrs class, as needed for deserialization."""
+
+    def make_field(f: "attr.Attribute[Any]") -> _DeserializableField:
+        assert f.type is not None, "fields should be typed"
+        deserializer = getattr(f.type, "deserialize", None)
+        try:
+            isinstance(None, f.type)
+        except TypeError:
+            # This might happen for Union types (e.g. Optional[X]), we assume
+            # the type is okay waiting for a better strategy.
+            checkable = False
+        else:
+            checkable = True
+        return _DeserializableField(
+            f.name, f.type, f.default is attr.NOTHING, deserializer, checkable
+        )
+
+    return tuple(make_field(f) for f in attr.fields(cls))
+
 
 class Deserializable:
     """Mixin class adding deserialization support.
@@ -70,44 +108,33 @@ class Deserializable:
     TypeError: invalid type for field 'color', expecting <class 'str'>
     """
 
+    # Empty slots, so that subclasses using slots do not get a __dict__.
+    __slots__ = ()
+
     @classmethod
     def deserialize(cls: Type[T], data: Mapping[str, Any]) -> T:
         args = {}
-        for field in attr.fields(cls):
+        for field in _deserializable_fields(cast(type, cls)):
             name = field.name
-            try:
-                value = data[name]
-            except KeyError:
-                if field.default != attr.NOTHING:
+            value = data.get(name, _MISSING)
+            if value is _MISSING:
+                if not field.required:
                     continue
-                raise ValueError(f"missing required field '{name}'") from None
-            else:
-                try:
-                    deserializer = getattr(field.type, "deserialize")
-                except AttributeError:
-                    assert field.type is not None, "fields should be typed"
-                    try:
-                        is_subtype = isinstance(value, field.type)
-                    except TypeError:
-                        # This might happen for Union types (e.g.
-                        # Optional[X]), we assume the type is okay waiting for
-                        # a better strategy.
-                        pass
-                    else:
-                        if not is_subtype:
-                            raise TypeError(
-                                f"invalid type for field '{name}', expecting {field.type}"
-                            ) from None
-                else:
-                    value = deserializer(value)
-
-                args[name] = value
-
-        unknown = set(data) - set(args)
-        if unknown:
-            raise ValueError(
-                f"unknown field(s): {', '.join(sorted(unknown))}"
-            ) from None
+                raise ValueError(f"missing required field '{name}'")
+            if field.deserializer is not None:
+                value = field.deserializer(value)
+            elif field.checkable and not isinstance(value, field.type):
+                raise TypeError(
+                    f"invalid type for field '{name}', expecting {field.type}"
+                )
+
+            args[name] = value
+
+        # All known fields from 'data' are in 'args', so any extra item is
+        # an unknown field.
+        if len(data) > len(args):
+            unknown = set(data) - set(args)
+            raise ValueError(f"unknown field(s): {', '.join(sorted(unknown))}")
 
         return cls(**args)  # type: ignore
 
@@ -131,7 +158,17 @@ def enum_next(e: E) -> E:
     >>> enum_next(Seasons.autumn)
     <Seasons.winter: 1>
     """
-    return e.__class__((e.value % max(e.__class__)) + 1)
+    successors: Dict[E, E] = _enum_successors(e.__class__)
+    return successors[e]
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_successors(cls: Type[E]) -> Dict[E, E]:
+    """Return a mapping of members of an enum to their successor, cycling
+    from last to first one.
+    """
+    members = list(cls)
+    return dict(zip(members, members[1:] + members[:1]))
 
 
 @enum.unique
@@ -165,7 +202,15 @@ class Flag(enum.IntFlag):
     PID = 16384
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def all(cls) -> "Flag":
+        """Return the flag with all columns set.
+
+        >>> Flag.all() is Flag.all()
+        True
+        >>> int(Flag.all())
+        32767
+        """
         return cls(sum(cls))
 
     @classmethod
@@ -211,45 +256,32 @@ class Flag(enum.IntFlag):
         >>> Flag.from_options(is_local=False, **options)
         <Flag.MODE|TYPE|RELATION|WAIT|USER|CLIENT|APPNAME: 7694>
         """
-        flag = cls.all()
-        if nodb:
-            flag ^= cls.DATABASE
-        if nouser:
-            flag ^= cls.USER
-        if nocpu:
-            flag ^= cls.CPU
-        if noclient:
-            flag ^= cls.CLIENT
-        if nomem:
-            flag ^= cls.MEM
-        if noread:
-            flag ^= cls.READ
-        if nowrite:
-            flag ^= cls.WRITE
-        if notime:
-            flag ^= cls.TIME
-        if nowait:
-            flag ^= cls.WAIT
-        if noappname:
-            flag ^= cls.APPNAME
-        if nopid:
-            flag ^= cls.PID
+        disabled = sum(
+            column
+            for column, no in (
+                (cls.DATABASE, nodb),
+                (cls.USER, nouser),
+                (cls.CPU, nocpu),
+                (cls.CLIENT, noclient),
+                (cls.MEM, nomem),
+                (cls.READ, noread),
+                (cls.WRITE, nowrite),
+                (cls.TIME, notime),
+                (cls.WAIT, nowait),
+                (cls.APPNAME, noappname),
+                (cls.PID, nopid),
+            )
+            if no
+        )
+        flag = cls(cls.all() & ~disabled)
 
         # Remove some if no running against local pg server.
-        if not is_local and (flag & cls.CPU):
-            flag ^= cls.CPU
-        if not is_local and (flag & cls.MEM):
-            flag ^= cls.MEM
-        if not is_local and (flag & cls.READ):
-            flag ^= cls.READ
-        if not is_local and (flag & cls.WRITE):
-            flag ^= cls.WRITE
-        if not is_local and (flag & cls.IOWAIT):
-            flag ^= cls.IOWAIT
+        if not is_local:
+            flag &= ~(cls.CPU | cls.MEM | cls.READ | cls.WRITE | cls.IOWAIT)
         return flag
 
 
-class SortKey(enum.Enum):
+class SortKey(enum.IntEnum):
     cpu = enum.auto()
     mem = enum.auto()
     read = enum.auto()
@@ -273,7 +305,7 @@ class QueryDisplayMode(enum.IntEnum):
 
 
 @enum.unique
-class QueryMode(enum.Enum):
+class QueryMode(str, enum.Enum):
     activities = "running queries"
     waiting = "waiting queries"
     blocking = "blocking queries"
@@ -323,6 +355,7 @@ class Column:
     color_key: Union[str, Callable[[Any], str]] = attr.ib(
         default=_color_key_marker, repr=False
     )
+    _title: str = attr.ib(init=False, repr=False, eq=False)
 
     @template_h.validator
     def _template_h_is_a_format_string_(self, attribute: Any, value: str) -> None:
@@ -347,12 +380,13 @@ class Column:
     def __attrs_post_init__(self) -> None:
         if self.color_key == _color_key_marker:
             object.__setattr__(self, "color_key", self.key)
+        object.__setattr__(self, "_title", self.template_h % self.name)
 
     def title_render(self) -> str:
-        return self.template_h % self.name
+        return self._title
 
     def title_color(self, sort_by: SortKey) -> str:
-        if self.sort_key == sort_by:
+        if self.sort_key is sort_by:
             return "cyan"  # TODO: define a Color enum
         return "green"
 
@@ -378,10 +412,35 @@ class UI:
         default=QueryDisplayMode.default(), converter=QueryDisplayMode
     )
     sort_key: SortKey = attr.ib(default=SortKey.default(), converter=SortKey)
-    query_mode: QueryMode = attr.ib(default=QueryMode.activities, converter=QueryMode)
+    query_mode: QueryMode = attr.ib(
+        default=QueryMode.activities,
+        converter=QueryMode,
+        on_setattr=lambda self, attribute, value: self._set_columns(value),
+    )
     refresh_time: Union[float, int] = 2
     in_pause: bool = False
     interactive_timeout: Optional[int] = None
+    _columns_by_key: Mapping[QueryMode, Mapping[str, Column]] = attr.ib(
+        init=False, repr=False
+    )
+    # Columns for current query mode.
+    _columns: Tuple[Column, ...] = attr.ib(init=False, repr=False)
+
+    @_columns.default
+    def _columns_default(self) -> Tuple[Column, ...]:
+        return self.columns_by_querymode[self.query_mode]
+
+    def _set_columns(self, query_mode: QueryMode) -> QueryMode:
+        """Update columns for current mode as 'query_mode' is set."""
+        self._columns = self.columns_by_querymode[query_mode]
+        return query_mode
+
+    @_columns_by_key.default
+    def _columns_by_key_default(self) -> Mapping[QueryMode, Mapping[str, Column]]:
+        return {
+            qm: {c.key: c for c in columns}
+            for qm, columns in self.columns_by_querymode.items()
+        }
 
     @classmethod
     def make(
@@ -669,11 +728,10 @@ class UI:
           ...
         ValueError: gloups
         """
-        for column in self.columns_by_querymode[self.query_mode]:
-            if column.key == key:
-                return column
-        else:
-            raise ValueError(key)
+        try:
+            return self._columns_by_key[self.query_mode][key]
+        except KeyError:
+            raise ValueError(key) from None
 
     def columns(self) -> Tuple[Column, ...]:
         """Return the tuple of Column for current mode.
@@ -682,8 +740,11 @@ class UI:
         >>> ui = UI.make(flag=flag)
         >>> [c.name for c in ui.columns()]
         ['PID', 'DATABASE', 'APP', 'state', 'Query']
+        >>> ui.evolve(query_mode=QueryMode.waiting)
+        >>> [c.name for c in ui.columns()]
+        ['PID', 'DATABASE', 'APP', 'RELATION', 'state', 'Query']
         """
-        return self.columns_by_querymode[self.query_mode]
+        return self._columns
 
 
 @attr.s(auto_attribs=True, frozen=True, slots=True)
@@ -832,7 +893,7 @@ def locktype(value: str) -> LockType:
         raise ValueError(f"invalid lock type {exc}") from None
 
 
-@attr.s(auto_attribs=True, slots=True)
+@attr.s(auto_attribs=True, slots=True, eq=False, weakref_slot=False)
 class BaseProcess:
     pid: int
     appname: str
@@ -845,7 +906,7 @@ class BaseProcess:
     is_parallel_worker: bool
 
 
-@attr.s(auto_attribs=True, frozen=True, slots=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True, eq=False, weakref_slot=False)
 class RunningProcess(BaseProcess, Deserializable):
     """Process for a running query."""
 
@@ -853,7 +914,7 @@ class RunningProcess(BaseProcess, Deserializable):
     is_parallel_worker: bool
 
 
-@attr.s(auto_attribs=True, frozen=True, slots=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True, eq=False, weakref_slot=False)
 class BWProcess(BaseProcess):
     """Process for a blocking or waiting query."""
 
@@ -867,7 +928,7 @@ class BWProcess(BaseProcess):
     is_parallel_worker: bool = attr.ib(default=False, init=False)
 
 
-@attr.s(auto_attribs=True, frozen=True, slots=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True, eq=False, weakref_slot=False)
 class SystemProcess(Deserializable):
     meminfo: Tuple[int, ...]
     io_read: IOCounter
@@ -882,7 +943,7 @@ class SystemProcess(Deserializable):
     psutil_proc: Optional[psutil.Process]
 
 
-@attr.s(auto_attribs=True, frozen=True, slots=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True, eq=False, weakref_slot=False)
 class LocalRunningProcess(RunningProcess):
     cpu: float
     mem: float
@@ -894,7 +955,9 @@ class LocalRunningProcess(RunningProcess):
     def from_process(
         cls, process: RunningProcess, **kwargs: Union[float, str]
     ) -> "LocalRunningProcess":
-        return cls(**dict(attr.asdict(process), **kwargs))
+        values = {a.name: getattr(process, a.name) for a in attr.fields(type(process))}
+        values.update(kwargs)
+        return cls(**values)
 
 
 @attr.s(auto_attribs=True, slots=True)
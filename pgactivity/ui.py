@@ -1,8 +1,8 @@
+import contextlib
 import optparse
 import time
-from typing import Dict, List, Optional, cast
+from typing import IO, Dict, List, Optional, cast
 
-import attr
 from blessed import Terminal
 
 from . import __version__, activities, handlers, keys, types, utils, views, widgets
@@ -43,11 +43,20 @@ def main(
     key, in_help = None, False
     sys_procs: Dict[int, types.SystemProcess] = {}
     pg_procs = types.SelectableProcesses([])
+    system_info = types.SystemInfo.default()
     activity_stats: types.ActivityStats
 
     msg_pile = utils.MessagePile(2)
 
-    with term.fullscreen(), term.cbreak(), term.hidden_cursor():
+    with contextlib.ExitStack() as stack:
+        # Keep the output file open for the whole session, rather than
+        # re-opening it at every refresh.
+        output: Optional[IO[str]] = None
+        if options.output is not None:
+            output = stack.enter_context(open(options.output, "a"))
+        stack.enter_context(term.fullscreen())
+        stack.enter_context(term.cbreak())
+        stack.enter_context(term.hidden_cursor())
         while True:
             if key == keys.HELP:
                 in_help = True
@@ -149,34 +158,24 @@ def main(
                     )
 
             else:
-                pg_db_info = data.pg_get_db_info(
-                    pg_db_info, using_rds=options.rds, skip_sizes=skip_sizes
-                )
-                if options.nodbsize and not skip_sizes:
-                    skip_sizes = True
+                # Database information is kept as is while paused.
+                if not ui.in_pause:
+                    pg_db_info = data.pg_get_db_info(
+                        pg_db_info, using_rds=options.rds, skip_sizes=skip_sizes
+                    )
+                    if options.nodbsize and not skip_sizes:
+                        skip_sizes = True
 
-                dbinfo = types.DBInfo(
-                    total_size=int(pg_db_info["total_size"]),
-                    size_ev=int(pg_db_info["size_ev"]),
-                )
-                tps = int(pg_db_info["tps"])
+                    dbinfo = types.DBInfo(
+                        total_size=int(pg_db_info["total_size"]),
+                        size_ev=int(pg_db_info["size_ev"]),
+                    )
+                    tps = int(pg_db_info["tps"])
 
-                active_connections = data.pg_get_active_connections()
-                memory, swap, load = activities.mem_swap_load()
-                system_info = types.SystemInfo.default(
-                    memory=memory, swap=swap, load=load
-                )
+                    active_connections = data.pg_get_active_connections()
 
                 if not ui.in_pause and not ui.interactive():
-                    if is_local:
-                        memory, swap, load = activities.mem_swap_load()
-                        system_info = attr.evolve(
-                            system_info,
-                            memory=memory,
-                            swap=swap,
-                            load=load,
-                        )
-
+                    io_read = io_write = types.IOCounter.default()
                     if ui.query_mode == types.QueryMode.activities:
                         pg_procs.set_items(data.pg_get_activities(ui.duration_mode))
                         if is_local:
@@ -186,16 +185,6 @@ def main(
                                 sys_procs,
                                 fs_blocksize,
                             )
-                            system_info = attr.evolve(
-                                system_info,
-                                io_read=io_read,
-                                io_write=io_write,
-                                max_iops=activities.update_max_iops(
-                                    system_info.max_iops,
-                                    io_read.count,
-                                    io_write.count,
-                                ),
-                            )
                             pg_procs.set_items(local_pg_procs)
 
                     else:
@@ -206,11 +195,24 @@ def main(
                         else:
                             assert False  # help type checking
 
+                    if is_local:
+                        memory, swap, load = activities.mem_swap_load()
+                        system_info = types.SystemInfo(
+                            memory,
+                            swap,
+                            load,
+                            io_read,
+                            io_write,
+                            activities.update_max_iops(
+                                system_info.max_iops, io_read.count, io_write.count
+                            ),
+                        )
+
                     activity_stats = (pg_procs, system_info) if is_local else pg_procs  # type: ignore
 
-                if options.output is not None:
-                    with open(options.output, "a") as f:
-                        utils.csv_write(f, map(attr.asdict, pg_procs.items))
+                if output is not None:
+                    utils.csv_write(output, pg_procs.items)
+                    output.flush()
 
                 views.screen(
                     term,
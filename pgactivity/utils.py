@@ -1,13 +1,37 @@
 import functools
-import re
-from datetime import datetime, timedelta
-from typing import Any, IO, Iterable, List, Mapping, Optional, Tuple
+from datetime import datetime
+from typing import Any, IO, Iterable, List, Optional, Tuple
 
 import attr
-import humanize
 
 
-naturalsize = functools.partial(humanize.naturalsize, gnu=True, format="%.2f")
+# GNU-style size units, along with their upper bound.
+_SIZE_UNITS = tuple((1024 ** (n + 2), suffix) for n, suffix in enumerate("KMGTPEZY"))
+
+
+def naturalsize(value: float) -> str:
+    """Format a number of bytes like a human readable size, GNU-style
+    (i.e. like 'ls -sh').
+
+    >>> naturalsize(300)
+    '300B'
+    >>> naturalsize(3000)
+    '2.93K'
+    >>> naturalsize(-3000)
+    '-2.93K'
+    >>> naturalsize(3 * 1024**3)
+    '3.00G'
+    >>> naturalsize(2 * 1024**9)
+    '2048.00Y'
+    """
+    size = float(value)
+    abs_size = abs(size)
+    if abs_size < 1024:
+        return "%dB" % size
+    for unit, suffix in _SIZE_UNITS:
+        if abs_size < unit:
+            break
+    return f"{1024 * size / unit:.2f}{suffix}"
 
 
 @attr.s(auto_attribs=True, frozen=True, slots=True)
@@ -58,12 +82,7 @@ def clean_str(string: str) -> str:
     >>> clean_str("\n a a  b   b    c \n\t\n c\v\n")
     'a a b b c c'
     """
-    msg = str(string)
-    msg = msg.replace("\n", " ")
-    msg = re.sub(r"\s+", r" ", msg)
-    msg = re.sub(r"^\s", r"", msg)
-    msg = re.sub(r"\s$", r"", msg)
-    return msg
+    return " ".join(str(string).split())
 
 
 def get_duration(duration: Optional[float]) -> float:
@@ -76,9 +95,12 @@ def get_duration(duration: Optional[float]) -> float:
     >>> get_duration(12)
     12.0
     """
-    if duration is None or float(duration) < 0:
+    if duration is None:
+        return 0
+    duration = float(duration)
+    if duration < 0:
         return 0
-    return float(duration)
+    return duration
 
 
 @functools.lru_cache(maxsize=2)
@@ -111,13 +133,13 @@ def format_duration(duration: Optional[float]) -> Tuple[str, str]:
             color = "time_yellow"
         else:
             color = "time_red"
-        duration_d = timedelta(seconds=float(duration))
-        mic = "%.6d" % duration_d.microseconds
-        ctime = "%s:%s.%s" % (
-            str((duration_d.seconds // 60)).zfill(2),
-            str((duration_d.seconds % 60)).zfill(2),
-            mic[:2],
-        )
+        # Split duration as timedelta would, rounding to the microsecond.
+        seconds = int(duration)
+        microseconds = round((duration - seconds) * 1_000_000)
+        if microseconds == 1_000_000:
+            seconds, microseconds = seconds + 1, 0
+        minutes, seconds = divmod(seconds, 60)
+        ctime = f"{minutes:02d}:{seconds:02d}.{microseconds // 10_000:02d}"
     else:
         ctime = "%s h" % str(int(duration / 3600))
         color = "time_red"
@@ -143,12 +165,14 @@ def short_state(state: str) -> str:
 
 def csv_write(
     fobj: IO[str],
-    procs: Iterable[Mapping[str, Any]],
+    procs: Iterable[Any],
     *,
     delimiter: str = ";",
 ) -> None:
     """Store process list into CSV file.
 
+    Process fields are read as attributes, missing ones are written as "N/A".
+
     >>> processes = [
     ...     {'pid': 25199, 'appname': '', 'database': 'pgbench', 'user': None,
     ...      'client': 'local', 'cpu': 0.0, 'mem': 0.6504979545924837,
@@ -171,6 +195,8 @@ def csv_write(
     ...      'user': 'postgres', 'client': 'local', 'state': 'active',
     ...      'query': 'BEGIN;', 'duration': 0, 'wait': False}
     ... ]
+    >>> from types import SimpleNamespace
+    >>> processes = [SimpleNamespace(**p) for p in processes]
     >>> import tempfile
     >>> with tempfile.NamedTemporaryFile(mode='w+') as f:
     ...     csv_write(f, processes[:2])
@@ -218,22 +244,22 @@ def csv_write(
             return "N/A"
         return yn(value)
 
+    dt = datetime.utcnow().strftime("%Y-%m-%dT%H:%m:%SZ")
     for p in procs:
-        dt = datetime.utcnow().strftime("%Y-%m-%dT%H:%m:%SZ")
-        pid = p.get("pid", "N/A")
-        database = p.get("database", "N/A")
-        appname = p.get("appname", "N/A")
-        user = p.get("user", "N/A")
-        client = p.get("client", "N/A")
-        cpu = p.get("cpu", "N/A")
-        mem = p.get("mem", "N/A")
-        read = p.get("read", "N/A")
-        write = p.get("write", "N/A")
-        duration = p.get("duration", "N/A")
-        wait = yn_na(p.get("wait"))
-        io_wait = yn_na(p.get("io_wait"))
-        state = p.get("state", "N/A")
-        query = clean_str_csv(p.get("query", "N/A"))
+        pid = getattr(p, "pid", "N/A")
+        database = getattr(p, "database", "N/A")
+        appname = getattr(p, "appname", "N/A")
+        user = getattr(p, "user", "N/A")
+        client = getattr(p, "client", "N/A")
+        cpu = getattr(p, "cpu", "N/A")
+        mem = getattr(p, "mem", "N/A")
+        read = getattr(p, "read", "N/A")
+        write = getattr(p, "write", "N/A")
+        duration = getattr(p, "duration", "N/A")
+        wait = yn_na(getattr(p, "wait", None))
+        io_wait = yn_na(getattr(p, "io_wait", None))
+        state = getattr(p, "state", "N/A")
+        query = clean_str_csv(getattr(p, "query", "N/A"))
         fobj.write(
             delimiter.join(
                 [
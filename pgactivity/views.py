@@ -1,9 +1,12 @@
+import contextlib
 import functools
 import inspect
+import io
 from textwrap import dedent
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -41,7 +44,7 @@ from .types import (
     UI,
 )
 from . import colors, utils
-from .activities import sorted as sorted_processes
+from .activities import sort as sort_processes
 
 
 class line_counter:
@@ -114,12 +117,13 @@ def limit(func: Callable[..., Iterable[str]]) -> Callable[..., None]:
     line_counter(9)
     """
 
+    accepts_width = "width" in inspect.signature(func).parameters
+
     @functools.wraps(func)
     def wrapper(term: Terminal, *args: Any, **kwargs: Any) -> None:
         counter = kwargs.pop("lines_counter", None)
         width = kwargs.pop("width", None)
-        signature = inspect.signature(func)
-        if "width" in signature.parameters:
+        if accepts_width:
             kwargs["width"] = width
         for line in func(term, *args, **kwargs):
             print(shorten(term, line, width) + term.clear_eol)
@@ -147,10 +151,8 @@ def render_iocounter(i: IOCounter, column_width: int) -> str:
 
 
 def _columns(left: str, right: str, total_width: int) -> str:
-    column_width, r = divmod(total_width, 2)
-    if r:
-        column_width -= 1
-    return " - ".join([left.rjust(column_width - 1), right.ljust(column_width - 1)])
+    width = max(total_width // 2 - total_width % 2 - 1, 0)
+    return f"{left:>{width}} - {right:<{width}}"
 
 
 @limit
@@ -176,7 +178,7 @@ def help(term: Terminal, version: str, is_local: bool) -> Iterable[str]:
 
     bindings = BINDINGS
     if not is_local:
-        bindings = [b for b in bindings if not b.local_only]
+        bindings = tuple(b for b in bindings if not b.local_only)
     yield from key_mappings(bindings)
     yield "Mode"
     yield from key_mappings(MODES)
@@ -246,16 +248,16 @@ def header(
     if system_info is not None:
         yield indent(
             row(
-                ("Mem.", render(system_info.memory, col_width // 2), col_width),
+                ("Mem.", render_meminfo(system_info.memory, col_width // 2), col_width),
                 ("IO Max", f"{system_info.max_iops:8}/s", col_width // 4),
             )
         )
         yield indent(
             row(
-                ("Swap", render(system_info.swap, col_width // 2), col_width),
+                ("Swap", render_meminfo(system_info.swap, col_width // 2), col_width),
                 (
                     "Read",
-                    render(system_info.io_read, col_width // 2 - len("Read")),
+                    render_iocounter(system_info.io_read, col_width // 2 - len("Read")),
                     col_width,
                 ),
             )
@@ -270,7 +272,9 @@ def header(
                 ),
                 (
                     "Write",
-                    render(system_info.io_write, col_width // 2 - len("Write")),
+                    render_iocounter(
+                        system_info.io_write, col_width // 2 - len("Write")
+                    ),
                     col_width,
                 ),
             )
@@ -327,6 +331,7 @@ def get_indent(ui: UI) -> str:
     return indent
 
 
+@functools.lru_cache(maxsize=512)
 def format_query(query: str, is_parallel_worker: bool) -> str:
     r"""Return the query string formatted.
 
@@ -339,6 +344,58 @@ def format_query(query: str, is_parallel_worker: bool) -> str:
     return prefix + utils.clean_str(query)
 
 
+@functools.lru_cache(maxsize=512)
+def layout_query(
+    term: Terminal,
+    query: str,
+    verbose_mode: QueryDisplayMode,
+    indent: str,
+    width: int,
+) -> str:
+    """Return the query string laid out for the Query column, following
+    'verbose_mode', with 'indent' being the width taken by previous columns.
+
+    Results are cached as the same queries usually show up at each refresh.
+
+    >>> term = Terminal()
+    >>> query = "SELECT a, b FROM t"
+    >>> layout_query(term, query, QueryDisplayMode.truncate, "   ", 12)
+    'SELECT a,'
+    >>> print(layout_query(term, query, QueryDisplayMode.wrap, "   ", 12))
+    SELECT a,
+       b FROM t
+    >>> print(layout_query(term, query, QueryDisplayMode.wrap_noindent, "   ", 12))
+    SELECT a,
+    b FROM t
+    """
+    dif = width - len(indent)
+    if verbose_mode == QueryDisplayMode.truncate:
+        query_value = query[:dif]
+    else:
+        if verbose_mode == QueryDisplayMode.wrap_noindent:
+            if term.length(query.split(" ", 1)[0]) >= dif:
+                # Query too long to even start on the first line, wrap all
+                # lines.
+                query_lines = term.wrap(query, width=width)
+            else:
+                # Only wrap subsequent lines.
+                wrapped_lines = term.wrap(query, width=dif)
+                if wrapped_lines:
+                    query_lines = [wrapped_lines[0]] + term.wrap(
+                        " ".join(wrapped_lines[1:]), width=width
+                    )
+                else:
+                    query_lines = []
+            query_value = "\n".join(query_lines)
+        else:
+            assert (
+                verbose_mode == QueryDisplayMode.wrap
+            ), f"unexpected mode {verbose_mode}"
+            wrapped_lines = term.wrap(query, width=dif)
+            query_value = f"\n{indent}".join(wrapped_lines)
+    return query_value
+
+
 @limit
 def processes_rows(
     term: Terminal,
@@ -351,13 +408,25 @@ def processes_rows(
     if width is None:
         width = term.width
 
+    # Formatting strings, by color type then by field, resolved on first use.
+    formatters: Dict[str, Dict[str, FormattingString]] = {}
+
     def color_for(field: str) -> FormattingString:
-        return getattr(term, colors.FIELD_BY_MODE[field][color_type])
+        try:
+            return formatters[color_type][field]
+        except KeyError:
+            formatters[color_type] = {
+                f: getattr(term, modes[color_type])
+                for f, modes in colors.FIELD_BY_MODE.items()
+            }
+            return formatters[color_type][field]
+
+    normal = term.normal
 
     def text_append(value: str) -> None:
         # We also restore 'normal' style so that the next item does not
         # inherit previous one's style.
-        text.append(value + term.normal)
+        text.append(value + normal)
 
     def cell(
         value: Any,
@@ -367,6 +436,18 @@ def processes_rows(
 
     focused, pinned = processes.focused, processes.pinned
 
+    # Columns are the same for all rows, the query one being rendered last.
+    columns = [column for column in ui.columns() if column.key != "query"]
+    query_column = ui.column("query")
+
+    indent = get_indent(ui) + " "
+    dif = width - len(indent)
+
+    verbose_mode = ui.verbose_mode
+    if dif < 0:
+        # Switch to wrap_noindent mode if terminal is too narrow.
+        verbose_mode = QueryDisplayMode.wrap_noindent
+
     for process in processes:
         if process.pid == focused:
             color_type = "cursor"
@@ -375,47 +456,14 @@ def processes_rows(
         else:
             color_type = "default"
         text: List[str] = []
-        for column in ui.columns():
-            field = column.key
-            if field != "query":
-                cell(getattr(process, field), column)
-
-        indent = get_indent(ui) + " "
-        dif = width - len(indent)
-
-        verbose_mode = ui.verbose_mode
-        if dif < 0:
-            # Switch to wrap_noindent mode if terminal is too narrow.
-            verbose_mode = QueryDisplayMode.wrap_noindent
+        for column in columns:
+            cell(getattr(process, column.key), column)
 
         query = format_query(process.query, process.is_parallel_worker)
 
-        if verbose_mode == QueryDisplayMode.truncate:
-            query_value = query[:dif]
-        else:
-            if verbose_mode == QueryDisplayMode.wrap_noindent:
-                if term.length(query.split(" ", 1)[0]) >= dif:
-                    # Query too long to even start on the first line, wrap all
-                    # lines.
-                    query_lines = term.wrap(query, width=width)
-                else:
-                    # Only wrap subsequent lines.
-                    wrapped_lines = term.wrap(query, width=dif)
-                    if wrapped_lines:
-                        query_lines = [wrapped_lines[0]] + term.wrap(
-                            " ".join(wrapped_lines[1:]), width=width
-                        )
-                    else:
-                        query_lines = []
-                query_value = "\n".join(query_lines)
-            else:
-                assert (
-                    verbose_mode == QueryDisplayMode.wrap
-                ), f"unexpected mode {verbose_mode}"
-                wrapped_lines = term.wrap(query, width=dif)
-                query_value = f"\n{indent}".join(wrapped_lines)
+        query_value = layout_query(term, query, verbose_mode, indent, width)
 
-        cell(query_value, ui.column("query"))
+        cell(query_value, query_column)
 
         for line in ("".join(text) + term.normal).splitlines():
             yield line
@@ -498,38 +546,45 @@ def screen(
         processes, system_info = activity_stats
     else:
         processes, system_info = activity_stats, None
-    processes.set_items(sorted_processes(processes, key=ui.sort_key, reverse=True))
-
-    print(term.home, end="")
     top_height = term.height - (1 if render_footer else 0)
+
+    # Each process takes at least one line, so only those fitting on screen
+    # need to be sorted.
+    sort_processes(processes.items, key=ui.sort_key, reverse=True, limit=top_height)
     lines_counter = line_counter(top_height)
 
-    if render_header:
-        header(
+    # Render the frame into a buffer, in order to write it at once.
+    frame = io.StringIO()
+    with contextlib.redirect_stdout(frame):
+        print(term.home, end="")
+
+        if render_header:
+            header(
+                term,
+                ui,
+                host=host,
+                dbinfo=dbinfo,
+                pg_version=pg_version,
+                tps=tps,
+                active_connections=active_connections,
+                system_info=system_info,
+                lines_counter=lines_counter,
+                width=width,
+            )
+
+        query_mode(term, ui, lines_counter=lines_counter, width=width)
+        columns_header(term, ui, lines_counter=lines_counter, width=width)
+        processes_rows(
             term,
             ui,
-            host=host,
-            dbinfo=dbinfo,
-            pg_version=pg_version,
-            tps=tps,
-            active_connections=active_connections,
-            system_info=system_info,
+            processes,
             lines_counter=lines_counter,
             width=width,
         )
 
-    query_mode(term, ui, lines_counter=lines_counter, width=width)
-    columns_header(term, ui, lines_counter=lines_counter, width=width)
-    processes_rows(
-        term,
-        ui,
-        processes,
-        lines_counter=lines_counter,
-        width=width,
-    )
-
-    # Clear remaining lines in screen until footer (or EOS)
-    print(f"{term.clear_eol}\n" * lines_counter.value, end="")
+        # Clear remaining lines in screen until footer (or EOS)
+        print(f"{term.clear_eol}\n" * lines_counter.value, end="")
+    print(frame.getvalue(), end="")
 
     if render_footer:
         with term.location(x=0, y=top_height):
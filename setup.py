@@ -47,9 +47,8 @@ setup(
     keywords="postgresql activity monitoring cli sql top",
     python_requires=">=3.6",
     install_requires=[
-        "attrs",
+        "attrs >= 20.1.0",
         "blessed",
-        "humanize",
         "psutil >= 2.0.0",
     ],
     extras_require={
@@ -1,6 +1,6 @@
 import json
 from collections import namedtuple
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import attr
 import pytest
@@ -49,7 +49,7 @@ def system_processes(shared_datadir):
 def test_ps_complete(system_processes):
     pg_processes, system_procs, new_system_procs, fs_blocksize = system_processes
 
-    def sys_get_proc(pid):
+    def sys_get_proc(pid, io_time=None, psutil_proc=None):
         return new_system_procs.pop(pid, None)
 
     n_system_procs = len(system_procs)
@@ -92,7 +92,7 @@ def test_ps_complete_empty_procs(system_processes):
     # same as test_ps_complete() but starting with an empty "system_procs" dict
     pg_processes, __, new_system_procs, fs_blocksize = system_processes
 
-    def sys_get_proc(pid):
+    def sys_get_proc(pid, io_time=None, psutil_proc=None):
         return new_system_procs.pop(pid, None)
 
     system_procs = {}
@@ -127,3 +127,33 @@ def test_mem_swap_load() -> None:
     assert memory == MemoryInfo(percent=12.3, used=26, total=45)
     assert swap == MemoryInfo(percent=6.7, used=8, total=90)
     assert load == LoadAverage(0.14, 0.27, 0.44)
+
+
+def test_ps_complete_dead_process(system_processes):
+    pg_processes, system_procs, new_system_procs, fs_blocksize = system_processes
+
+    dead_pid = pg_processes[0].pid
+    assert dead_pid in system_procs
+    del new_system_procs[dead_pid]
+    # Backends not listed anymore (e.g. idle ones) are kept while running, and
+    # dropped once gone.
+    idle_pid, gone_pid = 999_998, 999_999
+    assert not {idle_pid, gone_pid} & {p.pid for p in pg_processes}
+    system_procs[idle_pid] = attr.evolve(
+        system_procs[dead_pid], psutil_proc=Mock(**{"is_running.return_value": True})
+    )
+    system_procs[gone_pid] = attr.evolve(
+        system_procs[dead_pid], psutil_proc=Mock(**{"is_running.return_value": False})
+    )
+
+    def sys_get_proc(pid, io_time=None, psutil_proc=None):
+        return new_system_procs.pop(pid, None)
+
+    with patch("pgactivity.activities.sys_get_proc", new=sys_get_proc):
+        procs, __, __ = activities.ps_complete(pg_processes, system_procs, fs_blocksize)
+
+    assert len(procs) == len(pg_processes) - 1
+    assert dead_pid not in {p.pid for p in procs}
+    assert dead_pid not in system_procs
+    assert idle_pid in system_procs
+    assert gone_pid not in system_procs